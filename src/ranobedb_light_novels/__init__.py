@@ -14,9 +14,12 @@ __license__ = 'GPL v3'
 __copyright__ = '2024, RanobeDB Plugin Author'
 __docformat__ = 'restructuredtext en'
 
-import json
+import re
 import time
-from threading import Lock
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from threading import Event, Lock, Thread
 from urllib.parse import urlencode, quote_plus
 
 try:
@@ -24,9 +27,43 @@ try:
 except ImportError:
     from Queue import Empty, Queue
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
+except ImportError:
+    requests = None
+
 from calibre.ebooks.metadata import check_isbn
 from calibre.ebooks.metadata.book.base import Metadata
 from calibre.ebooks.metadata.sources.base import Option, Source
+from calibre.utils.date import local_tz
+
+_BOOK_URL_RE = re.compile(r'ranobedb\.org/book/(\d+)')
+
+# Supported title/name languages, in default preference order
+_LANGUAGES = ('en', 'romaji', 'ja')
+
+# Accepted spellings in the language_order preference
+_LANG_NORMALIZE = {
+    'en': 'en',
+    'english': 'en',
+    'ja': 'ja',
+    'japanese': 'ja',
+    'jp': 'ja',
+    'romaji': 'romaji',
+}
+
+# Series tag types imported as Calibre tags
+_TAG_TYPES = frozenset(('genre', 'tag'))
+
+# Keys _book_to_metadata reads that only the /book/{id} endpoint is known to return
+_DETAIL_KEYS = ('titles', 'editions', 'releases', 'publishers', 'series')
 
 
 class RanobeDBLightNovels(Source):
@@ -72,12 +109,30 @@ class RanobeDBLightNovels(Source):
     BASE_URL = 'https://ranobedb.org/api/v0'
     WEBSITE_URL = 'https://ranobedb.org'
     IMAGE_BASE_URL = 'https://images.ranobedb.org'
+    USER_AGENT = 'RanobeDB Light Novels Calibre Plugin/%d.%d.%d' % version
 
-    # Rate limiting: 60 requests/minute = 1 second between requests
+    # Rate limiting: 60 requests/minute = 1 second between requests.
+    # RATE_LIMIT_BURST is the token bucket capacity; keep it at 1 so no
+    # 60 second window can ever see more than 60 requests.
     RATE_LIMIT_DELAY = 1.0
-    _last_request_time = 0
+    RATE_LIMIT_BURST = 1.0
+    _tokens = RATE_LIMIT_BURST
+    _last_refill = time.monotonic()
     _rate_lock = Lock()
 
+    # Response caching: recent API responses are reused for 10 minutes
+    CACHE_TTL = 600
+    CACHE_MAX_ENTRIES = 256
+
+    # Worker threads used to fetch book details concurrently
+    MAX_WORKERS = 4
+
+    # Full details are fetched only for the best-ranked search results; the
+    # rest are returned from the search payload alone. A top result at or
+    # above HIGH_CONFIDENCE_SCORE is considered unambiguous.
+    DETAIL_FETCH_COUNT = 3
+    HIGH_CONFIDENCE_SCORE = 0.9
+
     # Configuration options
     options = (
         Option(
@@ -114,6 +169,13 @@ class RanobeDBLightNovels(Source):
 
     def __init__(self, *args, **kwargs):
         Source.__init__(self, *args, **kwargs)
+        self._session = None
+        self._session_lock = Lock()
+        self._response_cache = OrderedDict()
+        self._inflight = {}
+        self._cache_lock = Lock()
+        self._lang_order_cache = (None, None)
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
 
     # -------------------------------------------------------------------------
     # Rate Limiting
@@ -122,12 +184,124 @@ class RanobeDBLightNovels(Source):
     def _rate_limit(self):
         """
         Ensure we don't exceed RanobeDB's rate limit of 60 requests/minute.
+
+        Uses a token bucket refilled at one token per RATE_LIMIT_DELAY. Each
+        caller takes a token while holding the lock; if none is available the
+        balance goes negative (a reservation) and the caller sleeps for its
+        share outside of the lock, so waiting threads never block each other.
         """
+        cls = RanobeDBLightNovels
+        rate = 1.0 / self.RATE_LIMIT_DELAY
+
         with self._rate_lock:
-            elapsed = time.time() - RanobeDBLightNovels._last_request_time
-            if elapsed < self.RATE_LIMIT_DELAY:
-                time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-            RanobeDBLightNovels._last_request_time = time.time()
+            now = time.monotonic()
+            tokens = min(self.RATE_LIMIT_BURST, cls._tokens + (now - cls._last_refill) * rate)
+            cls._tokens = tokens - 1
+            cls._last_refill = now
+
+        if tokens < 1:
+            time.sleep((1 - tokens) / rate)
+
+    # -------------------------------------------------------------------------
+    # HTTP Helpers
+    # -------------------------------------------------------------------------
+
+    def _get_session(self):
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        The session keeps TCP/TLS connections to RanobeDB and its image host
+        alive between requests, and retries 5xx server errors with a short
+        backoff. 429 responses are left to the caller and _rate_limit.
+
+        :return: requests.Session, or None if requests is not available
+        """
+        if requests is None:
+            return None
+
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    # No 429 here: fast retries would skip _rate_limit and make it worse.
+                    # Ignoring Retry-After also stops urllib3 retrying a 429 on its own.
+                    retries = Retry(
+                        total=2,
+                        backoff_factor=0.3,
+                        status_forcelist=(500, 502, 503, 504),
+                        respect_retry_after_header=False,
+                    )
+                    session.mount(
+                        'https://',
+                        HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries),
+                    )
+                    # Advertise every content coding urllib3 can decode here
+                    # (gzip/deflate, plus br when brotli is installed)
+                    session.headers.update(
+                        make_headers(accept_encoding=True, user_agent=self.USER_AGENT)
+                    )
+                    self._session = session
+
+        return self._session
+
+    def _open_url(self, url, timeout=30, headers=None):
+        """
+        Fetch a URL, using the pooled session when available.
+
+        Falls back to Calibre's browser when requests is not installed; that
+        browser negotiates gzip itself because of supports_gzip_transfer_encoding.
+
+        :param url: URL to fetch
+        :param timeout: Request timeout in seconds
+        :param headers: Optional extra request headers (pooled session only)
+        :return: Response body as bytes
+        """
+        session = self._get_session()
+        if session is None:
+            return self.browser.open_novisit(url, timeout=timeout).read()
+
+        response = session.get(url, timeout=timeout, headers=headers)
+        response.raise_for_status()
+        return response.content
+
+    # -------------------------------------------------------------------------
+    # Response Caching
+    # -------------------------------------------------------------------------
+
+    def _get_cached_response(self, key):
+        """
+        Get a cached API response if it is still fresh.
+
+        Must be called with _cache_lock held.
+
+        :param key: Cache key from _make_api_request
+        :return: Parsed JSON response or None if missing/expired
+        """
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+
+        timestamp, data = entry
+        if time.monotonic() - timestamp > self.CACHE_TTL:
+            del self._response_cache[key]
+            return None
+
+        self._response_cache.move_to_end(key)
+        return data
+
+    def _set_cached_response(self, key, data):
+        """
+        Store an API response, evicting the least recently used entries.
+
+        Must be called with _cache_lock held.
+
+        :param key: Cache key from _make_api_request
+        :param data: Parsed JSON response
+        """
+        self._response_cache[key] = (time.monotonic(), data)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
 
     # -------------------------------------------------------------------------
     # Language Preference Helpers
@@ -137,54 +311,78 @@ class RanobeDBLightNovels(Source):
         """
         Parse user's language preference string into ordered list.
 
+        The parsed list is cached until the preference string changes, so
+        callers must not modify it.
+
         :return: List of language codes in preferred order, e.g. ['en', 'romaji', 'ja']
         """
         order_str = self.prefs.get('language_order', 'en,romaji,ja')
 
+        cached_str, cached_order = self._lang_order_cache
+        if order_str == cached_str:
+            return cached_order
+
         order = []
         for lang in order_str.split(','):
-            lang = lang.strip().lower()
-            # Normalize language codes
-            if lang in ('en', 'english'):
-                lang = 'en'
-            elif lang in ('ja', 'japanese', 'jp'):
-                lang = 'ja'
-            elif lang == 'romaji':
-                lang = 'romaji'
-            else:
-                continue
-
-            if lang not in order:
+            # Normalize language codes, skipping unknown ones
+            lang = _LANG_NORMALIZE.get(lang.strip().lower())
+            if lang and lang not in order:
                 order.append(lang)
 
         # Ensure all languages are included as fallbacks
-        for lang in ['en', 'romaji', 'ja']:
+        for lang in _LANGUAGES:
             if lang not in order:
                 order.append(lang)
 
+        self._lang_order_cache = (order_str, order)
         return order
 
-    def _select_by_language(self, options):
+    def _select_by_language(self, options, lang_order=None):
         """
         Select value based on user's language preference order.
 
         :param options: Dict with keys 'en', 'romaji', 'ja' and corresponding values
+        :param lang_order: Parsed language order (read from prefs if None)
         :return: First non-empty value in preferred order, or None
         """
-        order = self._parse_language_order()
+        order = lang_order or self._parse_language_order()
 
+        # _parse_language_order always lists every key in _LANGUAGES, so this
+        # covers all options; callers only use those three keys
         for lang in order:
             value = options.get(lang)
             if value:
                 return value
 
-        # Fallback to any non-None value
-        for value in options.values():
-            if value:
-                return value
-
         return None
 
+    def _is_selectable(self, options, lang, lang_order=None):
+        """
+        Check whether a value for lang could still win _select_by_language.
+
+        :param options: Dict with keys 'en', 'romaji', 'ja' and corresponding values
+        :param lang: Language code to check
+        :param lang_order: Parsed language order (read from prefs if None)
+        :return: False if a more preferred language already has a value
+        """
+        order = lang_order or self._parse_language_order()
+
+        for preferred in order:
+            if preferred == lang:
+                return True
+            if options.get(preferred):
+                return False
+
+        return True
+
+    def _get_max_results(self):
+        """
+        Get the configured maximum number of search results, clamped to 1-25.
+
+        :return: Result limit integer
+        """
+        return min(max(1, self.prefs.get('max_results', 10)), 25)
+
     # -------------------------------------------------------------------------
     # API Request Helpers
     # -------------------------------------------------------------------------
@@ -193,26 +391,71 @@ class RanobeDBLightNovels(Source):
         """
         Make a rate-limited request to the RanobeDB API.
 
+        Successful responses are cached in memory for CACHE_TTL seconds, so
+        repeated lookups skip both the network and JSON parsing. Concurrent
+        calls for the same request share a single HTTP call.
+
         :param endpoint: API endpoint (e.g., '/books' or '/book/123')
         :param params: Optional query parameters dict
         :param log: Log object for debugging
         :param timeout: Request timeout in seconds
         :return: Parsed JSON response or None on error
         """
-        self._rate_limit()
-
         url = self.BASE_URL + endpoint
         if params:
             url += '?' + urlencode(params)
 
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        with self._cache_lock:
+            cached = self._get_cached_response(key)
+            if cached is None:
+                future = self._inflight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = self._inflight[key] = Future()
+
+        if cached is not None:
+            if log:
+                log.info('RanobeDB API cache hit: %s' % url)
+            return cached
+
+        if not is_leader:
+            # The thread that started this request always resolves the future
+            if log:
+                log.info('RanobeDB API request already in flight: %s' % url)
+            return future.result()
+
+        data = None
+        try:
+            data = self._fetch_json(url, log, timeout)
+        finally:
+            with self._cache_lock:
+                if data is not None:
+                    self._set_cached_response(key, data)
+                del self._inflight[key]
+            future.set_result(data)
+
+        return data
+
+    def _fetch_json(self, url, log=None, timeout=30):
+        """
+        Fetch and parse a JSON document, honouring the rate limit.
+
+        Responses are parsed with orjson when it is installed.
+
+        :param url: Full request URL
+        :param log: Log object for debugging
+        :param timeout: Request timeout in seconds
+        :return: Parsed JSON response or None on error
+        """
+        self._rate_limit()
+
         if log:
             log.info('RanobeDB API request: %s' % url)
 
         try:
-            br = self.browser
-            response = br.open_novisit(url, timeout=timeout)
-            raw = response.read()
-            return json.loads(raw)
+            raw = self._open_url(url, timeout)
+            return _json.loads(raw)
         except Exception as e:
             if log:
                 log.exception('RanobeDB API request failed: %s' % str(e))
@@ -222,35 +465,30 @@ class RanobeDBLightNovels(Source):
     # Title/Language Helpers
     # -------------------------------------------------------------------------
 
-    def _get_preferred_title(self, book_data, log=None):
+    def _get_preferred_title(self, book_data, log=None, lang_order=None):
         """
         Get the title in the user's preferred language order.
 
         :param book_data: Book data from API
         :param log: Log object
+        :param lang_order: Parsed language order (read from prefs if None)
         :return: Tuple of (title, language_code)
         """
         titles_list = book_data.get('titles', [])
 
+        # Index titles array by language (later entries win)
+        titles_by_lang = {t.get('lang'): t.get('title') for t in titles_list if t.get('title')}
+
         # Build options dict with available titles
         options = {
-            'en': None,
+            'en': titles_by_lang.get('en'),
             'romaji': book_data.get('romaji') or book_data.get('romaji_orig'),
-            'ja': book_data.get('title_orig'),
+            'ja': titles_by_lang.get('ja') or book_data.get('title_orig'),
         }
 
-        # Extract titles from titles array
-        for t in titles_list:
-            lang = t.get('lang')
-            title_text = t.get('title')
-            if lang == 'en' and title_text:
-                options['en'] = title_text
-            elif lang == 'ja' and title_text:
-                options['ja'] = title_text
-            # Also check for romaji in title entries
-            romaji = t.get('romaji')
-            if romaji and not options['romaji']:
-                options['romaji'] = romaji
+        # Also check for romaji in title entries
+        if not options['romaji']:
+            options['romaji'] = next((t['romaji'] for t in titles_list if t.get('romaji')), None)
 
         # Use main title as fallback based on its language
         main_title = book_data.get('title')
@@ -261,26 +499,32 @@ class RanobeDBLightNovels(Source):
         elif main_lang == 'ja' and not options['ja']:
             options['ja'] = main_title
 
-        # If main title looks like English (mostly ASCII), use as English fallback
-        if main_title and not options['en']:
-            if all(
-                ord(c) < 128 for c in main_title.replace(' ', '').replace(':', '').replace('-', '')
-            ):
-                options['en'] = main_title
+        # If main title looks like English (all ASCII), use as English fallback,
+        # unless a more preferred title already exists and English can't win
+        if (
+            main_title
+            and not options['en']
+            and self._is_selectable(options, 'en', lang_order)
+            and main_title.isascii()
+        ):
+            options['en'] = main_title
 
         # Select based on user preference
-        title = self._select_by_language(options)
+        title = self._select_by_language(options, lang_order)
 
         # Determine the language of the selected title
+        # (an ASCII main title counts as English even when the heuristic was skipped)
         selected_lang = main_lang
-        if title == options['en']:
+        if title == options['en'] or (
+            not options['en'] and main_title and title == main_title and main_title.isascii()
+        ):
             selected_lang = 'en'
         elif title == options['ja']:
             selected_lang = 'ja'
 
         return title or main_title, selected_lang
 
-    def _extract_authors(self, book_data, log=None):
+    def _extract_authors(self, book_data, log=None, lang_order=None):
         """
         Extract authors from book editions data.
         Only includes staff with role_type 'author'.
@@ -288,24 +532,35 @@ class RanobeDBLightNovels(Source):
 
         :param book_data: Book data from API
         :param log: Log object
+        :param lang_order: Parsed language order (read from prefs if None)
         :return: List of author names
         """
         authors = []
+        seen = set()
+        seen_staff = set()
         editions = book_data.get('editions', [])
 
         for edition in editions:
             for staff in edition.get('staff', []):
                 if staff.get('role_type') == 'author':
+                    # The same author is usually listed in every edition
+                    romaji = staff.get('romaji')
+                    name = staff.get('name')
+                    if (romaji, name) in seen_staff:
+                        continue
+                    seen_staff.add((romaji, name))
+
                     # Build options for this author
                     # Note: API uses 'romaji' for romanized names, 'name' for Japanese
                     options = {
-                        'en': staff.get('romaji'),  # Romaji serves as English
-                        'romaji': staff.get('romaji'),
-                        'ja': staff.get('name'),
+                        'en': romaji,  # Romaji serves as English
+                        'romaji': romaji,
+                        'ja': name,
                     }
 
-                    author_name = self._select_by_language(options)
-                    if author_name and author_name not in authors:
+                    author_name = self._select_by_language(options, lang_order)
+                    if author_name and author_name not in seen:
+                        seen.add(author_name)
                         authors.append(author_name)
 
         return authors if authors else [_('Unknown')]
@@ -323,11 +578,13 @@ class RanobeDBLightNovels(Source):
             return []
 
         tags = []
+        seen = set()
         for tag in series_data.get('tags', []):
             ttype = tag.get('ttype')
-            if ttype in ('genre', 'tag'):
+            if ttype in _TAG_TYPES:
                 name = tag.get('name')
-                if name and name not in tags:
+                if name and name not in seen:
+                    seen.add(name)
                     tags.append(name)
 
         return tags
@@ -342,12 +599,17 @@ class RanobeDBLightNovels(Source):
         """
         releases = book_data.get('releases', [])
 
+        # Releases often repeat the same ISBN, so only validate each once
+        seen = set()
         for release in releases:
             isbn = release.get('isbn13')
-            if isbn:
-                validated = check_isbn(isbn)
-                if validated:
-                    return validated
+            if not isbn or isbn in seen:
+                continue
+            seen.add(isbn)
+
+            validated = check_isbn(isbn)
+            if validated:
+                return validated
 
         return None
 
@@ -355,23 +617,23 @@ class RanobeDBLightNovels(Source):
         """
         Parse RanobeDB date integer (YYYYMMDD format) to datetime.
 
+        Builds the datetime directly instead of round-tripping through
+        parse_date; the result matches parse_date on 'YYYY-MM-DD' (local
+        midnight).
+
         :param date_int: Date as integer (e.g., 20240115)
         :param log: Log object
         :return: datetime object or None
         """
-        if not date_int or date_int <= 0:
+        if not date_int or not 10000000 <= date_int <= 99999999:
             return None
 
+        year, month_day = divmod(date_int, 10000)
+        month, day = divmod(month_day, 100)
+
         try:
-            from calibre.utils.date import parse_date
-
-            date_str = str(date_int)
-            if len(date_str) == 8:
-                year = date_str[:4]
-                month = date_str[4:6]
-                day = date_str[6:8]
-                return parse_date(f'{year}-{month}-{day}')
-        except Exception as e:
+            return datetime(year, month, day, tzinfo=local_tz)
+        except ValueError as e:
             if log:
                 log.warning('Failed to parse date %s: %s' % (date_int, str(e)))
 
@@ -387,18 +649,21 @@ class RanobeDBLightNovels(Source):
         """
         image = book_data.get('image')
         if image and image.get('filename'):
-            return f'{self.IMAGE_BASE_URL}/{image["filename"]}'
+            return self.IMAGE_BASE_URL + '/' + image['filename']
         return None
 
-    def _get_description(self, book_data, log=None):
+    def _get_description(self, book_data, log=None, desc_lang=None):
         """
         Get book description based on user's language preference.
 
         :param book_data: Book data from API
         :param log: Log object
+        :param desc_lang: Description language preference (read from prefs if None)
         :return: Description string or None
         """
-        pref = self.prefs.get('description_language', 'en')
+        pref = desc_lang
+        if pref is None:
+            pref = self.prefs.get('description_language', 'en')
 
         desc_en = book_data.get('description')
         desc_ja = book_data.get('description_ja')
@@ -421,12 +686,13 @@ class RanobeDBLightNovels(Source):
     # Series Helpers
     # -------------------------------------------------------------------------
 
-    def _get_series_name(self, series_data, log=None):
+    def _get_series_name(self, series_data, log=None, lang_order=None):
         """
         Get series name in user's preferred language.
 
         :param series_data: Series data from API
         :param log: Log object
+        :param lang_order: Parsed language order (read from prefs if None)
         :return: Series name string or None
         """
         if not series_data:
@@ -457,25 +723,46 @@ class RanobeDBLightNovels(Source):
         elif olang == 'ja' and not options['ja']:
             options['ja'] = main_title
 
-        # If main title looks like English (mostly ASCII), use as English
-        if main_title and not options['en']:
-            if all(
-                ord(c) < 128
-                for c in main_title.replace(' ', '')
-                .replace(':', '')
-                .replace('-', '')
-                .replace("'", '')
-            ):
-                options['en'] = main_title
+        # If main title looks like English (all ASCII), use as English,
+        # unless a more preferred title already exists and English can't win
+        if (
+            main_title
+            and not options['en']
+            and self._is_selectable(options, 'en', lang_order)
+            and main_title.isascii()
+        ):
+            options['en'] = main_title
+
+        return self._select_by_language(options, lang_order) or main_title
+
+    def _get_series_book_index(self, series_data):
+        """
+        Get the series index of every book in a series, keyed by book ID.
+
+        Uses each book's sort_order if available, otherwise its position in
+        the list. The index is memoized on the series dict under '_book_index',
+        so every lookup on the same (possibly cached) payload shares one pass
+        over the list. The first entry wins if an ID is listed twice.
 
-        return self._select_by_language(options) or main_title
+        :param series_data: Series data from API
+        :return: Dict of book ID -> series index
+        """
+        index = series_data.get('_book_index')
+        if index is None:
+            index = {}
+            for idx, book in enumerate(series_data.get('books', []), start=1):
+                sort_order = book.get('sort_order')
+                index.setdefault(book.get('id'), sort_order if sort_order is not None else idx)
+            series_data['_book_index'] = index
+        return index
 
-    def _get_series_info(self, book_data, log=None):
+    def _get_series_info(self, book_data, log=None, lang_order=None):
         """
         Extract series information from book data.
 
         :param book_data: Book data from API
         :param log: Log object
+        :param lang_order: Parsed language order (read from prefs if None)
         :return: Tuple of (series_name, series_index) or (None, None)
         """
         series = book_data.get('series')
@@ -483,22 +770,10 @@ class RanobeDBLightNovels(Source):
             return None, None
 
         # Get series name in preferred language
-        series_name = self._get_series_name(series, log)
+        series_name = self._get_series_name(series, log, lang_order)
 
         # Find series index from the books list in series
-        series_index = None
-        book_id = book_data.get('id')
-        books = series.get('books', [])
-
-        for idx, book in enumerate(books, start=1):
-            if book.get('id') == book_id:
-                # Use sort_order if available, otherwise use position in list
-                sort_order = book.get('sort_order')
-                if sort_order is not None:
-                    series_index = sort_order
-                else:
-                    series_index = idx
-                break
+        series_index = self._get_series_book_index(series).get(book_data.get('id'))
 
         return series_name, series_index
 
@@ -515,7 +790,7 @@ class RanobeDBLightNovels(Source):
         """
         ranobedb_id = identifiers.get('ranobedb')
         if ranobedb_id:
-            url = f'{self.WEBSITE_URL}/book/{ranobedb_id}'
+            url = self.WEBSITE_URL + '/book/' + str(ranobedb_id)
             return ('ranobedb', ranobedb_id, url)
         return None
 
@@ -530,9 +805,7 @@ class RanobeDBLightNovels(Source):
         :param url: URL string
         :return: Tuple of (id_type, id_value) or None
         """
-        import re
-
-        match = re.search(r'ranobedb\.org/book/(\d+)', url)
+        match = _BOOK_URL_RE.search(url)
         if match:
             return ('ranobedb', match.group(1))
         return None
@@ -553,6 +826,23 @@ class RanobeDBLightNovels(Source):
             return self.cached_identifier_to_cover_url(ranobedb_id)
         return None
 
+    def _cache_book_data(self, book_id, isbn=None, cover_url=None):
+        """
+        Cache ISBN and cover URL mappings for a book.
+
+        Both writes happen under a single acquisition of Calibre's cache lock
+        (an RLock, so the nested acquisitions in the cache methods are cheap).
+
+        :param book_id: RanobeDB book ID string
+        :param isbn: Validated ISBN or None
+        :param cover_url: Cover URL or None
+        """
+        with self.cache_lock:
+            if isbn:
+                self.cache_isbn_to_identifier(isbn, book_id)
+            if cover_url:
+                self.cache_identifier_to_cover_url(book_id, cover_url)
+
     # -------------------------------------------------------------------------
     # Search/Identify
     # -------------------------------------------------------------------------
@@ -573,16 +863,19 @@ class RanobeDBLightNovels(Source):
             return title
         return ''
 
-    def _search_books(self, query, log, timeout=30):
+    def _search_books(self, query, log, timeout=30, lang_order=None, max_results=None):
         """
         Search for books on RanobeDB.
 
         :param query: Search query string
         :param log: Log object
         :param timeout: Request timeout
+        :param lang_order: Parsed language order (read from prefs if None)
+        :param max_results: Result limit (read from prefs if None)
         :return: List of book results
         """
-        max_results = min(max(1, self.prefs.get('max_results', 10)), 25)
+        if max_results is None:
+            max_results = self._get_max_results()
 
         params = {
             'q': query,
@@ -590,7 +883,8 @@ class RanobeDBLightNovels(Source):
         }
 
         # Add English language filter for releases if English is first preference
-        lang_order = self._parse_language_order()
+        if lang_order is None:
+            lang_order = self._parse_language_order()
         if lang_order and lang_order[0] == 'en':
             params['rl[]'] = 'en'
 
@@ -610,25 +904,36 @@ class RanobeDBLightNovels(Source):
         :param timeout: Request timeout
         :return: Book details dict or None
         """
-        response = self._make_api_request(f'/book/{book_id}', None, log, timeout)
+        response = self._make_api_request('/book/' + str(book_id), None, log, timeout)
         if response and 'book' in response:
             return response['book']
         return None
 
-    def _book_to_metadata(self, book_data, relevance, log):
+    def _has_book_details(self, book_data):
+        """
+        Check whether book data already contains the full details.
+
+        :param book_data: Book data from search or book API
+        :return: True if it can be passed to _book_to_metadata directly
+        """
+        return all(key in book_data for key in _DETAIL_KEYS)
+
+    def _book_to_metadata(self, book_data, relevance, log, lang_order=None, desc_lang=None):
         """
         Convert RanobeDB book data to Calibre Metadata object.
 
         :param book_data: Book data from API
         :param relevance: Source relevance integer
         :param log: Log object
+        :param lang_order: Parsed language order (read from prefs if None)
+        :param desc_lang: Description language preference (read from prefs if None)
         :return: Metadata object
         """
         # Get title in preferred language
-        title, lang = self._get_preferred_title(book_data, log)
+        title, lang = self._get_preferred_title(book_data, log, lang_order)
 
         # Get authors (only 'author' role)
-        authors = self._extract_authors(book_data, log)
+        authors = self._extract_authors(book_data, log, lang_order)
 
         # Create Metadata object
         mi = Metadata(title, authors)
@@ -641,10 +946,9 @@ class RanobeDBLightNovels(Source):
         isbn = self._extract_isbn(book_data, log)
         if isbn:
             mi.isbn = isbn
-            self.cache_isbn_to_identifier(isbn, book_id)
 
         # Set description/comments based on language preference
-        description = self._get_description(book_data, log)
+        description = self._get_description(book_data, log, desc_lang)
         if description:
             mi.comments = description
 
@@ -663,7 +967,7 @@ class RanobeDBLightNovels(Source):
             mi.language = lang
 
         # Set series information
-        series_name, series_index = self._get_series_info(book_data, log)
+        series_name, series_index = self._get_series_info(book_data, log, lang_order)
         if series_name:
             mi.series = series_name
             if series_index is not None:
@@ -675,10 +979,9 @@ class RanobeDBLightNovels(Source):
         if tags:
             mi.tags = tags
 
-        # Cache cover URL
+        # Cache ISBN and cover URL
         cover_url = self._get_cover_url(book_data, log)
-        if cover_url:
-            self.cache_identifier_to_cover_url(book_id, cover_url)
+        self._cache_book_data(book_id, isbn, cover_url)
 
         # Set source relevance for sorting
         mi.source_relevance = relevance
@@ -719,10 +1022,9 @@ class RanobeDBLightNovels(Source):
             mi.language = lang
 
         # Cache cover URL from search data
-        image = search_result.get('image')
-        if image and image.get('filename'):
-            cover_url = f'{self.IMAGE_BASE_URL}/{image["filename"]}'
-            self.cache_identifier_to_cover_url(book_id, cover_url)
+        cover_url = self._get_cover_url(search_result, log)
+        if cover_url:
+            self._cache_book_data(book_id, cover_url=cover_url)
 
         # Set source relevance for sorting
         mi.source_relevance = relevance
@@ -756,6 +1058,11 @@ class RanobeDBLightNovels(Source):
             % (title, authors, identifiers)
         )
 
+        # Snapshot preferences once; helpers would otherwise re-read them per book
+        lang_order = self._parse_language_order()
+        desc_lang = self.prefs.get('description_language', 'en')
+        max_results = self._get_max_results()
+
         # Check if we have a RanobeDB ID
         ranobedb_id = identifiers.get('ranobedb')
 
@@ -769,7 +1076,7 @@ class RanobeDBLightNovels(Source):
             book_data = self._get_book_details(ranobedb_id, log, timeout)
 
             if book_data:
-                mi = self._book_to_metadata(book_data, 0, log)
+                mi = self._book_to_metadata(book_data, 0, log, lang_order, desc_lang)
                 self.clean_downloaded_metadata(mi)
                 result_queue.put(mi)
                 log.info('RanobeDB: Found book: %s' % mi.title)
@@ -799,55 +1106,96 @@ class RanobeDBLightNovels(Source):
             return None
 
         # Search for books
-        search_results = self._search_books(query, log, timeout)
+        search_results = self._search_books(query, log, timeout, lang_order, max_results)
 
         if not search_results:
             log.info('RanobeDB: No results found')
             return None
 
+        # Drop hits without an ID and repeated IDs so no book is fetched twice
+        seen_ids = set()
+        unique_results = []
+        for book in search_results:
+            book_id = book.get('id')
+            if book_id and book_id not in seen_ids:
+                seen_ids.add(book_id)
+                unique_results.append(book)
+        search_results = unique_results
+
         log.info('RanobeDB: Found %d results' % len(search_results))
 
         # Determine how many results to fetch full details for
-        # High similarity (>=0.9): fetch only top 1 (fast path)
-        # Otherwise: fetch top 3 for comparison
+        # High similarity: fetch only top 1 (fast path)
+        # Otherwise: fetch top DETAIL_FETCH_COUNT for comparison
         top_score = search_results[0].get('sim_score', 0) if search_results else 0
-        if top_score >= 0.9:
+        if top_score >= self.HIGH_CONFIDENCE_SCORE:
             fetch_count = 1
             log.info(
                 'RanobeDB: High confidence match (score %.2f), fetching top 1 only' % top_score
             )
         else:
-            fetch_count = min(3, len(search_results))
+            fetch_count = min(self.DETAIL_FETCH_COUNT, len(search_results))
             log.info('RanobeDB: Fetching full details for top %d results' % fetch_count)
 
         # Fetch full details for top results (includes authors, series, etc.)
+        # concurrently. _rate_limit still spaces out the requests, but parsing
+        # and metadata assembly overlap with the wait for the next slot.
+        futures = {}
         for relevance, book in enumerate(search_results[:fetch_count]):
             if abort.is_set():
                 break
 
-            book_id = book.get('id')
-            if not book_id:
-                continue
-
-            log.info('RanobeDB: Fetching details for book ID: %s' % book_id)
+            book_id = book['id']
 
-            book_data = self._get_book_details(book_id, log, timeout)
-
-            if book_data:
-                mi = self._book_to_metadata(book_data, relevance, log)
+            # Skip the detail request if the search payload is already complete
+            if self._has_book_details(book):
+                mi = self._book_to_metadata(book, relevance, log, lang_order, desc_lang)
                 self.clean_downloaded_metadata(mi)
                 result_queue.put(mi)
                 log.info('RanobeDB: Added full result: %s by %s' % (mi.title, mi.authors))
+                continue
+
+            log.info('RanobeDB: Fetching details for book ID: %s' % book_id)
+
+            future = self._executor.submit(self._get_book_details, book_id, log, timeout)
+            futures[future] = relevance
 
         # Return basic metadata for remaining results (no API calls - fast!)
+        # right away, while the detail fetches above are still in flight.
+        # All of them are built first, then queued together.
+        metadatas = []
         for relevance, book in enumerate(search_results[fetch_count:], start=fetch_count):
             if abort.is_set():
                 break
 
-            mi = self._book_to_basic_metadata(book, relevance, log)
+            if self._has_book_details(book):
+                mi = self._book_to_metadata(book, relevance, log, lang_order, desc_lang)
+                log.info('RanobeDB: Added full result: %s by %s' % (mi.title, mi.authors))
+            else:
+                mi = self._book_to_basic_metadata(book, relevance, log)
+                log.info('RanobeDB: Added basic result: %s' % mi.title)
+            metadatas.append(mi)
+
+        for mi in metadatas:
             self.clean_downloaded_metadata(mi)
             result_queue.put(mi)
-            log.info('RanobeDB: Added basic result: %s' % mi.title)
+
+        # Queue each full result as soon as its fetch completes
+        for future in as_completed(futures):
+            if abort.is_set():
+                for pending in futures:
+                    pending.cancel()
+                break
+
+            book_data = future.result()
+
+            if book_data:
+                mi = self._book_to_metadata(
+                    book_data, futures[future], log, lang_order, desc_lang
+                )
+                self.clean_downloaded_metadata(mi)
+                result_queue.put(mi)
+                log.info('RanobeDB: Added full result: %s by %s' % (mi.title, mi.authors))
 
         return None
 
@@ -855,6 +1203,67 @@ class RanobeDBLightNovels(Source):
     # Cover Download
     # -------------------------------------------------------------------------
 
+    def _identify_cover_url(self, log, abort, title, authors, identifiers, timeout):
+        """
+        Run identify in the background and find the best cover URL.
+
+        Results are inspected as they arrive. As soon as the top-ranked result
+        has a cover URL, the rest of the identify run is stopped so the cover
+        download does not wait behind detail fetches for worse matches.
+
+        :param log: Log object for debugging
+        :param abort: Event to check for abort signal
+        :param title: Book title (optional)
+        :param authors: List of authors (optional)
+        :param identifiers: Dict of identifiers
+        :param timeout: Request timeout in seconds
+        :return: Cover URL string or None
+        """
+        rq = Queue()
+        stop = Event()
+        worker = Thread(
+            target=self.identify,
+            args=(log, rq, stop),
+            kwargs={
+                'title': title,
+                'authors': authors,
+                'identifiers': identifiers,
+                'timeout': timeout,
+            },
+            daemon=True,
+        )
+        worker.start()
+
+        results = []
+        try:
+            while not abort.is_set():
+                try:
+                    mi = rq.get(timeout=0.1)
+                except Empty:
+                    # All results are queued before the worker exits
+                    if not worker.is_alive() and rq.empty():
+                        break
+                    continue
+
+                if mi.source_relevance == 0:
+                    cover_url = self.get_cached_cover_url(mi.identifiers)
+                    if cover_url:
+                        return cover_url
+
+                results.append(mi)
+        finally:
+            stop.set()
+
+        # Fall back to the best-ranked result that has a cover
+        results.sort(key=lambda x: x.source_relevance)
+
+        for mi in results:
+            cover_url = self.get_cached_cover_url(mi.identifiers)
+            if cover_url:
+                return cover_url
+
+        return None
+
     def download_cover(
         self,
         log,
@@ -886,37 +1295,11 @@ class RanobeDBLightNovels(Source):
         if cached_url is None:
             # No cached URL, try to identify first
             log.info('RanobeDB: No cached cover URL, running identify')
-
-            rq = Queue()
-            self.identify(
-                log,
-                rq,
-                abort,
-                title=title,
-                authors=authors,
-                identifiers=identifiers,
-                timeout=timeout,
-            )
+            cached_url = self._identify_cover_url(log, abort, title, authors, identifiers, timeout)
 
             if abort.is_set():
                 return
 
-            # Get results and find cover URL
-            results = []
-            while True:
-                try:
-                    results.append(rq.get_nowait())
-                except Empty:
-                    break
-
-            # Sort by relevance
-            results.sort(key=lambda x: x.source_relevance)
-
-            for mi in results:
-                cached_url = self.get_cached_cover_url(mi.identifiers)
-                if cached_url:
-                    break
-
         if cached_url is None:
             log.info('RanobeDB: No cover URL found')
             return
@@ -928,8 +1311,8 @@ class RanobeDBLightNovels(Source):
 
         try:
             self._rate_limit()
-            br = self.browser
-            cover_data = br.open_novisit(cached_url, timeout=timeout).read()
+            # Images are already compressed, so don't ask for gzip
+            cover_data = self._open_url(cached_url, timeout, {'Accept-Encoding': 'identity'})
 
             if cover_data:
                 result_queue.put((self, cover_data))
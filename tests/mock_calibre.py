@@ -6,13 +6,44 @@ can be tested without Calibre installed.
 """
 
 import re
+import sys
+import threading
+from collections import ChainMap
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError
 from urllib.request import urlopen, Request
 from urllib.parse import urlencode
 import json
 import ssl
 
+try:
+    import urllib3
+    from urllib3.util import Retry
+except ImportError:
+    urllib3 = None
+
+try:
+    from msgspec.json import decode as _json_decode
+except ImportError:
+    _json_decode = json.loads
+
+
+# Patterns used by the tokenizers
+_SUBTITLE_RE = re.compile(r"[\(\[\{].*?[\)\]\}]|[/:\\].*$")
+_TITLE_PUNCT_RE = re.compile(r'[,:;!@$%^&*(){}.`~"\[\]/]')
+_AUTHOR_SPLIT_RE = re.compile(r"[-+.:;,]")
+
+# Words dropped from title and author tokens
+_TITLE_JOINERS = frozenset(("a", "and", "the", "&"))
+_AUTHOR_STOPWORDS = frozenset(("von", "van", "unknown"))
+
+# Plain character deletions are done with str.translate
+_AUTHOR_DELETE_TABLE = str.maketrans("", "", '!@#$%^&*(){}~"[]/ \t\n\r')
+_ISBN_DELETE_TABLE = str.maketrans("", "", "- \t\n\r")
+
 
 # Mock the _() translation function
 def _(text):
@@ -26,7 +57,11 @@ import builtins
 builtins._ = _
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class MockMetadata:
     """
     Mock implementation of calibre.ebooks.metadata.book.base.Metadata
@@ -51,6 +86,9 @@ class MockMetadata:
     # Source relevance for sorting
     source_relevance: int = 0
 
+    # Display text cached by test_interactive.format_metadata_full
+    _formatted_full: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def set_identifier(self, key: str, value: str):
         """Set an identifier."""
         self.identifiers[key] = value
@@ -90,31 +128,63 @@ class MockMetadata:
         }
 
 
+# SSL context that doesn't verify certificates (for testing), shared by all
+# browsers on the urllib fallback path
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Shared urllib3 connection pool (created on first use), so repeated requests
+# to the same host reuse keep-alive connections
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = urllib3.PoolManager(
+                    maxsize=10,
+                    # Ignore Retry-After so a 429 reaches the plugin's rate limiter
+                    retries=Retry(total=2, backoff_factor=0.3, respect_retry_after_header=False),
+                    cert_reqs="CERT_NONE",
+                )
+                # Verification is off on purpose; don't warn on every request
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return _pool
+
+
 class MockBrowser:
     """
     Mock implementation of Calibre's browser for HTTP requests.
-    Uses urllib for actual HTTP requests.
+    Uses a pooled urllib3 client when available, urllib otherwise.
     """
 
     def __init__(self, user_agent: str = None):
         self.user_agent = user_agent or "Mozilla/5.0 (compatible; CalibrePlugin/1.0)"
-        # Create SSL context that doesn't verify certificates (for testing)
-        self._ssl_context = ssl.create_default_context()
-        self._ssl_context.check_hostname = False
-        self._ssl_context.verify_mode = ssl.CERT_NONE
 
     def open_novisit(self, url: str, timeout: int = 30) -> "MockResponse":
         """Open a URL without adding to history."""
-        request = Request(url)
-        request.add_header("User-Agent", self.user_agent)
-        request.add_header("Accept", "application/json")
-
-        response = urlopen(request, timeout=timeout, context=self._ssl_context)
+        headers = {"User-Agent": self.user_agent, "Accept": "application/json"}
+
+        if urllib3 is not None:
+            response = _get_pool().request(
+                "GET", url, headers=headers, timeout=timeout, preload_content=False
+            )
+            if response.status >= 400:
+                response.release_conn()
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return MockResponse(response)
+
+        request = Request(url, headers=headers)
+        response = urlopen(request, timeout=timeout, context=_SSL_CONTEXT)
         return MockResponse(response)
 
     def clone_browser(self) -> "MockBrowser":
-        """Clone the browser."""
-        return MockBrowser(self.user_agent)
+        """Clone the browser (shared, since it holds no per-request state)."""
+        return self
 
 
 class MockResponse:
@@ -128,8 +198,16 @@ class MockResponse:
         """Read response data."""
         if self._data is None:
             self._data = self._response.read()
+            # Hand pooled connections back once the body is consumed
+            release_conn = getattr(self._response, "release_conn", None)
+            if release_conn is not None:
+                release_conn()
         return self._data
 
+    def json(self, decoder=_json_decode):
+        """Decode the response body as JSON (msgspec if installed)."""
+        return decoder(self.read())
+
 
 class MockLog:
     """Mock log object for debugging output."""
@@ -137,14 +215,18 @@ class MockLog:
     def __init__(self, verbose: bool = True):
         self.verbose = verbose
         self.messages = []
+        self._append = self.messages.append
 
     def _log(self, level: str, msg: str):
-        self.messages.append((level, msg))
+        self._append((level, msg))
         if self.verbose:
-            print(f"[{level}] {msg}")
+            # One write per line, so concurrent searches don't split lines
+            sys.stdout.write(f"[{level}] {msg}\n")
 
     def info(self, msg: str):
-        self._log("INFO", msg)
+        self._append(("INFO", msg))
+        if self.verbose:
+            sys.stdout.write(f"[INFO] {msg}\n")
 
     def warning(self, msg: str):
         self._log("WARN", msg)
@@ -190,13 +272,11 @@ class MockPrefs:
     def __init__(self):
         self._prefs = {}
         self.defaults = {}
+        # Looks up stored values first, then defaults
+        self._chain = ChainMap(self._prefs, self.defaults)
 
     def get(self, key, default=None):
-        if key in self._prefs:
-            return self._prefs[key]
-        if key in self.defaults:
-            return self.defaults[key]
-        return default
+        return self._chain.get(key, default)
 
     def __setitem__(self, key, value):
         self._prefs[key] = value
@@ -205,6 +285,45 @@ class MockPrefs:
         return self.get(key)
 
 
+@lru_cache(maxsize=1024)
+def _title_tokens(title: str, strip_joiners: bool, strip_subtitle: bool) -> tuple:
+    """Tokenize a title (cached; backs MockSource.get_title_tokens)."""
+    # Strip subtitle if requested
+    if strip_subtitle:
+        title = _SUBTITLE_RE.sub("", title)
+
+    # Clean and tokenize
+    title = _TITLE_PUNCT_RE.sub(" ", title)
+    tokens = title.split()
+
+    joiners = _TITLE_JOINERS if strip_joiners else frozenset()
+
+    result = []
+    for token in tokens:
+        token = token.strip().strip('"').strip("'")
+        if token and token.lower() not in joiners:
+            result.append(token)
+    return tuple(result)
+
+
+@lru_cache(maxsize=1024)
+def _author_tokens(author: str) -> tuple:
+    """Tokenize one author name (cached; backs MockSource.get_author_tokens)."""
+    # Handle "Last, First" format
+    has_comma = "," in author
+    parts = _AUTHOR_SPLIT_RE.sub(" ", author).split()
+
+    if has_comma:
+        parts = parts[1:] + parts[:1]
+
+    result = []
+    for token in parts:
+        token = token.translate(_AUTHOR_DELETE_TABLE)
+        if len(token) > 2 and token.lower() not in _AUTHOR_STOPWORDS:
+            result.append(token)
+    return tuple(result)
+
+
 class MockSource:
     """
     Mock implementation of calibre.ebooks.metadata.sources.base.Source
@@ -228,10 +347,14 @@ class MockSource:
 
     options = ()
 
+    # ISBN/cover URL caches are shared by all instances, so testers created
+    # later in the same run start warm
+    _isbn_to_identifier_cache: Dict[str, str] = {}
+    _identifier_to_cover_url_cache: Dict[str, str] = {}
+    cache_lock = threading.RLock()
+
     def __init__(self):
         self._browser = None
-        self._isbn_to_identifier_cache = {}
-        self._identifier_to_cover_url_cache = {}
         self._prefs = MockPrefs()
 
         # Set default prefs from options
@@ -244,25 +367,30 @@ class MockSource:
 
     @property
     def browser(self):
+        # MockBrowser holds no per-request state, so one instance is shared
         if self._browser is None:
             self._browser = MockBrowser()
-        return self._browser.clone_browser()
+        return self._browser
 
     def cache_isbn_to_identifier(self, isbn: str, identifier: str):
         """Cache ISBN to identifier mapping."""
-        self._isbn_to_identifier_cache[isbn] = identifier
+        with self.cache_lock:
+            self._isbn_to_identifier_cache[isbn] = identifier
 
     def cached_isbn_to_identifier(self, isbn: str) -> Optional[str]:
         """Get cached identifier for ISBN."""
-        return self._isbn_to_identifier_cache.get(isbn)
+        with self.cache_lock:
+            return self._isbn_to_identifier_cache.get(isbn)
 
     def cache_identifier_to_cover_url(self, identifier: str, url: str):
         """Cache identifier to cover URL mapping."""
-        self._identifier_to_cover_url_cache[identifier] = url
+        with self.cache_lock:
+            self._identifier_to_cover_url_cache[identifier] = url
 
     def cached_identifier_to_cover_url(self, identifier: str) -> Optional[str]:
         """Get cached cover URL for identifier."""
-        return self._identifier_to_cover_url_cache.get(identifier)
+        with self.cache_lock:
+            return self._identifier_to_cover_url_cache.get(identifier)
 
     def get_title_tokens(
         self, title: str, strip_joiners: bool = True, strip_subtitle: bool = False
@@ -271,21 +399,7 @@ class MockSource:
         if not title:
             return
 
-        # Strip subtitle if requested
-        if strip_subtitle:
-            title = re.sub(r"[\(\[\{].*?[\)\]\}]", "", title)
-            title = re.sub(r"[/:\\].*$", "", title)
-
-        # Clean and tokenize
-        title = re.sub(r'[,:;!@$%^&*(){}.`~"\[\]/]', " ", title)
-        tokens = title.split()
-
-        joiners = {"a", "and", "the", "&"} if strip_joiners else set()
-
-        for token in tokens:
-            token = token.strip().strip('"').strip("'")
-            if token and token.lower() not in joiners:
-                yield token
+        yield from _title_tokens(title, strip_joiners, strip_subtitle)
 
     def get_author_tokens(self, authors: List[str], only_first_author: bool = True):
         """Extract tokens from authors for search."""
@@ -296,17 +410,7 @@ class MockSource:
             authors = authors[:1]
 
         for author in authors:
-            # Handle "Last, First" format
-            has_comma = "," in author
-            parts = re.sub(r"[-+.:;,]", " ", author).split()
-
-            if has_comma:
-                parts = parts[1:] + parts[:1]
-
-            for token in parts:
-                token = re.sub(r'[!@#$%^&*(){}~"\s\[\]/]', "", token).strip()
-                if len(token) > 2 and token.lower() not in ("von", "van", "unknown"):
-                    yield token
+            yield from _author_tokens(author)
 
     def clean_downloaded_metadata(self, mi: MockMetadata):
         """Clean/normalize downloaded metadata."""
@@ -321,6 +425,7 @@ class MockSource:
             mi.authors = [a.strip() for a in mi.authors if a.strip()]
 
 
+@lru_cache(maxsize=4096)
 def check_isbn(isbn: str) -> Optional[str]:
     """
     Mock implementation of calibre.ebooks.metadata.check_isbn
@@ -331,37 +436,61 @@ def check_isbn(isbn: str) -> Optional[str]:
         return None
 
     # Remove hyphens and spaces
-    isbn = re.sub(r"[-\s]", "", isbn)
+    isbn = isbn.translate(_ISBN_DELETE_TABLE).upper()
+    # Like calibre, reject non-ASCII and one digit repeated (e.g. 0000000000)
+    if not isbn.isascii() or len(set(isbn)) == 1:
+        return None
 
-    # Check length
+    # Check length and checksum
     if len(isbn) == 10:
-        # ISBN-10 validation
-        if isbn[:-1].isdigit() and (isbn[-1].isdigit() or isbn[-1].upper() == "X"):
-            return isbn
+        # ISBN-10: weights 10..1, check digit may be X (10)
+        if isbn[:9].isdigit() and (isbn[9].isdigit() or isbn[9] == "X"):
+            total = sum(int(c) * w for c, w in zip(isbn[:9], range(10, 1, -1)))
+            total += 10 if isbn[9] == "X" else int(isbn[9])
+            if total % 11 == 0:
+                return isbn
     elif len(isbn) == 13:
-        # ISBN-13 validation
+        # ISBN-13: alternating weights 1 and 3
         if isbn.isdigit():
-            return isbn
+            total = sum(int(c) * (3 if i % 2 else 1) for i, c in enumerate(isbn))
+            if total % 10 == 0:
+                return isbn
 
     return None
 
 
+# Mock of calibre.utils.date.local_tz - naive datetimes stand in for local time
+local_tz = None
+
+
+# Formats tried by parse_date when the ISO fast path does not match
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%Y%m%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+)
+
+# YYYY-MM-DD, YYYY/MM/DD or YYYYMMDD
+_ISO_DATE_RE = re.compile(r"([0-9]{4})([-/]?)([0-9]{2})\2([0-9]{2})")
+
+
+@lru_cache(maxsize=256)
 def parse_date(date_str: str):
     """
     Mock implementation of calibre.utils.date.parse_date
     """
-    from datetime import datetime
-
-    # Try various formats
-    formats = [
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%Y%m%d",
-        "%d-%m-%Y",
-        "%d/%m/%Y",
-    ]
-
-    for fmt in formats:
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        year, _sep, month, day = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            return None
+
+    # Try the remaining formats
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -5,12 +5,23 @@ Batch test script for RanobeDB Light Novels plugin.
 Runs predefined tests against the RanobeDB API to verify plugin functionality.
 """
 
+import io
 import json
 import sys
-import time
+from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -151,95 +162,160 @@ BATCH_TESTS = [
     },
 ]
 
+# Lowercase the *_contains expectations once, at import (check_expectations
+# still lowercases them itself for test cases defined elsewhere)
+for _test_case in BATCH_TESTS:
+    _expected = _test_case.get('expected', {})
+    for _key in ('title_contains', 'author_contains'):
+        if _key in _expected:
+            _expected['_' + _key + '_lc'] = _expected[_key].lower()
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single batch test case."""
+
+    name: str
+    type: str
+    query: Dict[str, Any] = field(default_factory=dict)
+    success: bool = False
+    passed: bool = False
+    results_count: int = 0
+    results: List[dict] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    expectations_met: Dict[str, bool] = field(default_factory=dict)
+
 
 def ensure_results_dir():
     """Create results directory if it doesn't exist."""
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def run_single_test(tester, test_case: dict) -> dict:
-    """Run a single test case and return results."""
-    result = {
-        'name': test_case['name'],
-        'type': test_case['type'],
-        'query': {},
-        'success': False,
-        'passed': False,
-        'results_count': 0,
-        'results': [],
-        'errors': [],
-        'expectations_met': {},
-    }
+def _json_default(obj):
+    """Serialize dataclasses (e.g. BatchResult) for the stdlib json fallback."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
 
-    try:
-        # Build query
-        if test_case['type'] == 'title':
-            result['query'] = {'title': test_case.get('title', '')}
-            results = tester.search(title=test_case.get('title'))
-        elif test_case['type'] == 'title_author':
-            author = test_case.get('author')
-            result['query'] = {'title': test_case.get('title', ''), 'author': author}
-            results = tester.search(
-                title=test_case.get('title'), authors=[author] if author else None
-            )
-        elif test_case['type'] == 'id':
-            result['query'] = {'ranobedb_id': test_case.get('ranobedb_id')}
-            results = tester.search(identifiers={'ranobedb': test_case.get('ranobedb_id')})
-        else:
-            result['errors'].append(f'Unknown test type: {test_case["type"]}')
-            return result
-
-        result['success'] = True
-        result['results_count'] = len(results)
-        result['results'] = [mi.to_dict() for mi in results]
-
-        # Check expectations
-        expected = test_case.get('expected', {})
-        all_passed = True
-
-        # Check has_results
-        if 'has_results' in expected:
-            has_results = len(results) > 0
-            passed = has_results == expected['has_results']
-            result['expectations_met']['has_results'] = passed
-            if not passed:
-                all_passed = False
-
-        # Check min_results
-        if 'min_results' in expected:
-            passed = len(results) >= expected['min_results']
-            result['expectations_met']['min_results'] = passed
-            if not passed:
-                all_passed = False
-
-        # Check title_contains
-        if 'title_contains' in expected and results:
-            search_str = expected['title_contains'].lower()
-            passed = any(search_str in mi.title.lower() for mi in results)
-            result['expectations_met']['title_contains'] = passed
-            if not passed:
-                all_passed = False
-
-        # Check author_contains
-        if 'author_contains' in expected and results:
-            search_str = expected['author_contains'].lower()
-            passed = any(
-                any(search_str in author.lower() for author in mi.authors) for mi in results
-            )
-            result['expectations_met']['author_contains'] = passed
-            if not passed:
-                all_passed = False
-
-        result['passed'] = all_passed
 
+def write_json(filepath: Path, data: Any):
+    """Write data to filepath as indented JSON, using msgspec or orjson if installed."""
+    if msgspec is not None:
+        encoded = msgspec.json.encode(data, enc_hook=str)
+        filepath.write_bytes(msgspec.json.format(encoded, indent=2))
+        return
+
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+
+
+def build_search(test_case: dict) -> Tuple[dict, dict]:
+    """
+    Build the recorded query and PluginTester.search arguments for a test case.
+
+    :raises ValueError: For an unknown test type
+    """
+    if test_case['type'] == 'title':
+        query = {'title': test_case.get('title', '')}
+        return query, {'title': test_case.get('title')}
+    elif test_case['type'] == 'title_author':
+        author = test_case.get('author')
+        query = {'title': test_case.get('title', ''), 'author': author}
+        return query, {'title': test_case.get('title'), 'authors': [author] if author else None}
+    elif test_case['type'] == 'id':
+        query = {'ranobedb_id': test_case.get('ranobedb_id')}
+        return query, {'identifiers': {'ranobedb': test_case.get('ranobedb_id')}}
+
+    raise ValueError(f'Unknown test type: {test_case["type"]}')
+
+
+def check_expectations(result: BatchResult, test_case: dict, results: list):
+    """Record search results on result and check them against the test case."""
+    result.success = True
+    result.results_count = len(results)
+    result.results = [mi.to_dict() for mi in results]
+
+    # Check expectations
+    expected = test_case.get('expected', {})
+    all_passed = True
+
+    # Lowercase titles and authors once, only if a *_contains check needs them
+    lowered = []
+    if results and ('title_contains' in expected or 'author_contains' in expected):
+        lowered = [(mi.title.lower(), [author.lower() for author in mi.authors]) for mi in results]
+
+    # Check has_results
+    if 'has_results' in expected:
+        has_results = len(results) > 0
+        passed = has_results == expected['has_results']
+        result.expectations_met['has_results'] = passed
+        if not passed:
+            all_passed = False
+
+    # Check min_results
+    if 'min_results' in expected:
+        passed = len(results) >= expected['min_results']
+        result.expectations_met['min_results'] = passed
+        if not passed:
+            all_passed = False
+
+    # Check title_contains
+    if 'title_contains' in expected and results:
+        search_str = expected.get('_title_contains_lc') or expected['title_contains'].lower()
+        passed = any(search_str in title for title, _ in lowered)
+        result.expectations_met['title_contains'] = passed
+        if not passed:
+            all_passed = False
+
+    # Check author_contains
+    if 'author_contains' in expected and results:
+        search_str = expected.get('_author_contains_lc') or expected['author_contains'].lower()
+        passed = any(search_str in author for _, authors in lowered for author in authors)
+        result.expectations_met['author_contains'] = passed
+        if not passed:
+            all_passed = False
+
+    result.passed = all_passed
+
+
+def record_outcome(result: BatchResult, test_case: dict, outcome):
+    """Record a search outcome (result list or the exception it raised) on result."""
+    if isinstance(outcome, Exception):
+        result.errors.append(str(outcome))
+        result.success = False
+        return
+
+    try:
+        check_expectations(result, test_case, outcome)
     except Exception as e:
-        result['errors'].append(str(e))
-        result['success'] = False
+        result.errors.append(str(e))
+        result.success = False
+
+
+def print_report(index: int, result: BatchResult):
+    """Print one test's report with a single write."""
+    buf = io.StringIO()
+    print(f'[{index + 1}/{len(BATCH_TESTS)}] {result.name}...', end=' ', file=buf)
+
+    if result.passed:
+        print(f'PASSED ({result.results_count} results)', file=buf)
+    else:
+        print(f'FAILED', file=buf)
+        if result.errors:
+            print(f'        Errors: {result.errors}', file=buf)
+        for exp, met in result.expectations_met.items():
+            if not met:
+                print(f'        {exp}: FAILED', file=buf)
 
-    return result
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
-def run_batch_tests(tester=None, save_results: bool = True) -> List[dict]:
+def run_batch_tests(tester=None, save_results: bool = True) -> List[BatchResult]:
     """
     Run all batch tests.
 
@@ -259,30 +335,31 @@ def run_batch_tests(tester=None, save_results: bool = True) -> List[dict]:
     print('=' * 60)
     print(f'\nRunning {len(BATCH_TESTS)} tests...\n')
 
-    all_results = []
-    passed_count = 0
-    failed_count = 0
+    all_results = [BatchResult(name=tc['name'], type=tc['type']) for tc in BATCH_TESTS]
 
-    for i, test_case in enumerate(BATCH_TESTS, 1):
-        print(f'[{i}/{len(BATCH_TESTS)}] {test_case["name"]}...', end=' ', flush=True)
+    # Build every query up front; tests without a valid query fail right away
+    indexes = []
+    searches = []
+    for i, test_case in enumerate(BATCH_TESTS):
+        try:
+            all_results[i].query, search_kwargs = build_search(test_case)
+        except ValueError as e:
+            all_results[i].errors.append(str(e))
+            print_report(i, all_results[i])
+            continue
+        indexes.append(i)
+        searches.append(search_kwargs)
 
-        result = run_single_test(tester, test_case)
-        all_results.append(result)
+    # Run all searches concurrently, reporting each test as it finishes
+    def on_done(n, outcome):
+        i = indexes[n]
+        record_outcome(all_results[i], BATCH_TESTS[i], outcome)
+        print_report(i, all_results[i])
 
-        if result['passed']:
-            print(f'PASSED ({result["results_count"]} results)')
-            passed_count += 1
-        else:
-            print(f'FAILED')
-            if result['errors']:
-                print(f'        Errors: {result["errors"]}')
-            for exp, met in result['expectations_met'].items():
-                if not met:
-                    print(f'        {exp}: FAILED')
-            failed_count += 1
+    tester.search_many(searches, on_done)
 
-        # Rate limiting - wait between tests
-        time.sleep(1.1)
+    passed_count = sum(1 for result in all_results if result.passed)
+    failed_count = len(all_results) - passed_count
 
     # Summary
     print('\n' + '-' * 60)
@@ -303,8 +380,7 @@ def run_batch_tests(tester=None, save_results: bool = True) -> List[dict]:
             'tests': all_results,
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+        write_json(filepath, summary)
 
         print(f'\nResults saved to: {filepath}')
 
@@ -313,52 +389,7 @@ def run_batch_tests(tester=None, save_results: bool = True) -> List[dict]:
 
 def main():
     """Run batch tests from command line."""
-    # Set up imports
-    import builtins
-
-    builtins._ = lambda x: x
-
-    from mock_calibre import (
-        MockMetadata,
-        MockLog,
-        MockAbort,
-        MockSource,
-        MockOption,
-        MockPrefs,
-        MockBrowser,
-        check_isbn as _check_isbn,
-        parse_date as _parse_date,
-    )
-
-    # Mock calibre modules
-    class MockCalibreMetadata:
-        Metadata = MockMetadata
-
-    class MockCalibreSource:
-        Source = MockSource
-        Option = MockOption
-
-    class MockCalibreEbooksMetadata:
-        pass
-
-    MockCalibreEbooksMetadata.check_isbn = staticmethod(_check_isbn)
-
-    class MockCalibreUtilsDate:
-        pass
-
-    MockCalibreUtilsDate.parse_date = staticmethod(_parse_date)
-
-    sys.modules['calibre'] = type(sys)('calibre')
-    sys.modules['calibre.ebooks'] = type(sys)('calibre.ebooks')
-    sys.modules['calibre.ebooks.metadata'] = MockCalibreEbooksMetadata
-    sys.modules['calibre.ebooks.metadata.book'] = type(sys)('calibre.ebooks.metadata.book')
-    sys.modules['calibre.ebooks.metadata.book.base'] = MockCalibreMetadata
-    sys.modules['calibre.ebooks.metadata.sources'] = type(sys)('calibre.ebooks.metadata.sources')
-    sys.modules['calibre.ebooks.metadata.sources.base'] = MockCalibreSource
-    sys.modules['calibre.utils'] = type(sys)('calibre.utils')
-    sys.modules['calibre.utils.date'] = MockCalibreUtilsDate
-
-    # Now import and run
+    # PluginTester installs the calibre mocks it needs
     from test_interactive import PluginTester
 
     tester = PluginTester()
@@ -366,7 +397,7 @@ def main():
     results = run_batch_tests(tester)
 
     # Exit with error code if any tests failed
-    failed = sum(1 for r in results if not r['passed'])
+    failed = sum(1 for r in results if not r.passed)
     sys.exit(1 if failed > 0 else 0)
 
 
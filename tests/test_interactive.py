@@ -5,74 +5,95 @@ Interactive test script for RanobeDB Light Novels plugin.
 Allows testing the RanobeDB API and plugin logic without Calibre installed.
 """
 
+import atexit
 import json
 import os
+import re
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import deepcopy
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from queue import Queue
+from queue import Empty, Queue
+from threading import Lock
+from typing import TYPE_CHECKING
+from weakref import WeakSet
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / 'tests'))
 sys.path.insert(0, str(PROJECT_ROOT / 'src'))
 
-# Import mock calibre FIRST to set up the _ function
-from mock_calibre import (
-    MockMetadata,
-    MockLog,
-    MockAbort,
-    MockSource,
-    MockOption,
-    MockPrefs,
-    MockBrowser,
-    check_isbn,
-    parse_date,
-)
+if TYPE_CHECKING:
+    from mock_calibre import MockMetadata
 
-# Now we can import the plugin
-# We need to patch the imports before importing the plugin
-import builtins
+_mocks_installed = False
 
-builtins._ = lambda x: x
 
+def _install_mocks():
+    """
+    Import mock_calibre and patch sys.modules with the calibre mocks.
 
-# Mock the calibre modules
-class MockCalibreMetadata:
-    Metadata = MockMetadata
-
-
-class MockCalibreSource:
-    Source = MockSource
-    Option = MockOption
-
-
-class MockCalibreEbooksMetadata:
-    check_isbn = check_isbn
-
-
-class MockCalibreUtilsDate:
-    parse_date = parse_date
-
-
-# Patch sys.modules
-sys.modules['calibre'] = type(sys)('calibre')
-sys.modules['calibre.ebooks'] = type(sys)('calibre.ebooks')
-sys.modules['calibre.ebooks.metadata'] = MockCalibreEbooksMetadata
-sys.modules['calibre.ebooks.metadata.book'] = type(sys)('calibre.ebooks.metadata.book')
-sys.modules['calibre.ebooks.metadata.book.base'] = MockCalibreMetadata
-sys.modules['calibre.ebooks.metadata.sources'] = type(sys)('calibre.ebooks.metadata.sources')
-sys.modules['calibre.ebooks.metadata.sources.base'] = MockCalibreSource
-sys.modules['calibre.utils'] = type(sys)('calibre.utils')
-sys.modules['calibre.utils.date'] = MockCalibreUtilsDate
+    Done once, on first use, so importing this module stays cheap.
+    """
+    global _mocks_installed
+    if _mocks_installed:
+        return
 
-# Now import the plugin
-from ranobedb_light_novels import RanobeDBLightNovels
+    # Import mock calibre FIRST to set up the _ function
+    from mock_calibre import (
+        MockMetadata,
+        MockSource,
+        MockOption,
+        check_isbn,
+        local_tz,
+        parse_date,
+    )
+    import builtins
+
+    builtins._ = lambda x: x
+
+    # Mock the calibre modules
+    metadata_module = type(sys)('calibre.ebooks.metadata')
+    metadata_module.check_isbn = check_isbn
+    base_module = type(sys)('calibre.ebooks.metadata.book.base')
+    base_module.Metadata = MockMetadata
+    sources_base_module = type(sys)('calibre.ebooks.metadata.sources.base')
+    sources_base_module.Source = MockSource
+    sources_base_module.Option = MockOption
+    date_module = type(sys)('calibre.utils.date')
+    date_module.parse_date = parse_date
+    date_module.local_tz = local_tz
+
+    sys.modules['calibre'] = type(sys)('calibre')
+    sys.modules['calibre.ebooks'] = type(sys)('calibre.ebooks')
+    sys.modules['calibre.ebooks.metadata'] = metadata_module
+    sys.modules['calibre.ebooks.metadata.book'] = type(sys)('calibre.ebooks.metadata.book')
+    sys.modules['calibre.ebooks.metadata.book.base'] = base_module
+    sys.modules['calibre.ebooks.metadata.sources'] = type(sys)('calibre.ebooks.metadata.sources')
+    sys.modules['calibre.ebooks.metadata.sources.base'] = sources_base_module
+    sys.modules['calibre.utils'] = type(sys)('calibre.utils')
+    sys.modules['calibre.utils.date'] = date_module
+    _mocks_installed = True
+
+
+def load_plugin():
+    """Install the calibre mocks and return the plugin class."""
+    _install_mocks()
+
+    from ranobedb_light_novels import RanobeDBLightNovels
+
+    return RanobeDBLightNovels
 
 
 # Results directory
 RESULTS_DIR = PROJECT_ROOT / 'tests' / 'results'
 
+# Characters replaced with '_' in result filenames (letters, digits, '_' and '-' are kept)
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w-]')
+
 
 def ensure_results_dir():
     """Create results directory if it doesn't exist."""
@@ -87,7 +108,7 @@ def save_result(test_type: str, query: dict, results: list, success: bool, error
 
     # Create filename
     query_str = '_'.join(str(v) for v in query.values() if v)[:50]
-    query_str = ''.join(c if c.isalnum() or c in '-_' else '_' for c in query_str)
+    query_str = _FILENAME_UNSAFE_RE.sub('_', query_str)
     filename = f'{test_type}_{query_str}_{timestamp.strftime("%Y%m%d_%H%M%S")}.json'
 
     # Build result object
@@ -110,7 +131,7 @@ def save_result(test_type: str, query: dict, results: list, success: bool, error
     return filepath
 
 
-def format_metadata(mi: MockMetadata, index: int = None) -> str:
+def format_metadata(mi: 'MockMetadata', index: int = None) -> str:
     """Format metadata for display."""
     lines = []
 
@@ -131,10 +152,9 @@ def format_metadata(mi: MockMetadata, index: int = None) -> str:
         lines.append(f'    Series: {series_str}')
 
     if mi.tags:
-        lines.append(
-            f'    Tags: {", ".join(mi.tags[:5])}'
-            + (f' (+{len(mi.tags) - 5} more)' if len(mi.tags) > 5 else '')
-        )
+        more = len(mi.tags) - 5
+        more_str = f' (+{more} more)' if more > 0 else ''
+        lines.append(f'    Tags: {", ".join(mi.tags[:5])}{more_str}')
 
     if mi.publisher:
         lines.append(f'    Publisher: {mi.publisher}')
@@ -151,8 +171,12 @@ def format_metadata(mi: MockMetadata, index: int = None) -> str:
     return '\n'.join(lines)
 
 
-def format_metadata_full(mi: MockMetadata) -> str:
-    """Format full metadata for display."""
+def format_metadata_full(mi: 'MockMetadata') -> str:
+    """Format full metadata for display (cached on the metadata object)."""
+    cached = getattr(mi, '_formatted_full', None)
+    if cached is not None:
+        return cached
+
     lines = []
     lines.append('=' * 60)
     lines.append(f'Title: {mi.title}')
@@ -202,19 +226,82 @@ def format_metadata_full(mi: MockMetadata) -> str:
 
     lines.append('=' * 60)
 
-    return '\n'.join(lines)
+    mi._formatted_full = '\n'.join(lines)
+    return mi._formatted_full
+
+
+# Testers still open at exit; weak, so a discarded tester isn't kept alive
+_live_testers = WeakSet()
+
+
+@atexit.register
+def _close_testers():
+    """Close every tester that is still open when the interpreter exits."""
+    for tester in list(_live_testers):
+        tester.close()
 
 
 class PluginTester:
     """Interactive plugin tester."""
 
+    # Concurrent searches in search_many; the plugin's rate limiter still
+    # spaces out the API requests they make
+    MAX_WORKERS = 4
+
+    # Recent search results kept for repeated queries in the interactive menus
+    CACHE_MAX_ENTRIES = 128
+
     def __init__(self):
-        self.plugin = RanobeDBLightNovels()
+        self.plugin = load_plugin()()
+
+        from mock_calibre import MockAbort, MockLog
+
         self.log = MockLog(verbose=True)
         self.abort = MockAbort()
+        self._pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        self._cache = OrderedDict()
+        self._cache_lock = Lock()
+        _live_testers.add(self)
+
+    def close(self):
+        """Shut down the search pool, the plugin's worker pool and its HTTP session, if any."""
+        self._pool.shutdown(wait=False)
+        self.plugin._executor.shutdown(wait=False)
+        if self.plugin._session is not None:
+            self.plugin._session.close()
+        _live_testers.discard(self)
 
     def search(self, title: str = None, authors: list = None, identifiers: dict = None) -> list:
-        """Run a search and return results."""
+        """
+        Run a search and return results, cached per query for the interactive menus.
+
+        Only non-empty results are cached. Every call gets its own copies, so
+        changes a caller makes to the returned objects never reach the cache.
+        """
+        key = (title or '', tuple(authors or ()), tuple(sorted((identifiers or {}).items())))
+
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return deepcopy(cached)
+
+        results = self._search_one(title=title, authors=authors, identifiers=identifiers)
+
+        # Don't cache empty results; they may come from a timeout or API error
+        if results:
+            with self._cache_lock:
+                self._cache[key] = deepcopy(results)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+
+        return results
+
+    def _search_one(
+        self, title: str = None, authors: list = None, identifiers: dict = None
+    ) -> list:
+        """Run a search against the plugin (uncached) and return results sorted by relevance."""
         result_queue = Queue()
 
         self.plugin.identify(
@@ -228,14 +315,50 @@ class PluginTester:
         )
 
         results = []
-        while not result_queue.empty():
-            results.append(result_queue.get())
+        try:
+            while True:
+                results.append(result_queue.get_nowait())
+        except Empty:
+            pass
 
         # Sort by relevance
-        results.sort(key=lambda x: x.source_relevance)
-
+        results.sort(key=attrgetter('source_relevance'))
         return results
 
+    def clear_cache(self):
+        """Forget cached search results (e.g. after a preference change)."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def search_many(self, queries: list, on_done=None) -> list:
+        """
+        Run several searches concurrently, bypassing the result cache.
+
+        A search that raises does not stop the others; its exception is
+        returned in place of its result list.
+
+        :param queries: List of _search_one() keyword argument dicts
+        :param on_done: Optional callback(index, outcome), called in this thread
+            as each search finishes
+        :return: List of result lists (or exceptions), in query order
+        """
+        futures = {
+            self._pool.submit(self._search_one, **query): i for i, query in enumerate(queries)
+        }
+        outcomes = [None] * len(queries)
+
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = e
+            outcomes[i] = outcome
+            if on_done is not None:
+                on_done(i, outcome)
+
+        return outcomes
+
     def test_cover(self, identifiers: dict) -> bool:
         """Test cover download."""
         result_queue = Queue()
@@ -248,26 +371,27 @@ class PluginTester:
             timeout=30,
         )
 
-        if not result_queue.empty():
-            source, cover_data = result_queue.get()
-            print(f'\nCover downloaded successfully!')
-            print(f'Size: {len(cover_data)} bytes')
-
-            # Optionally save cover
-            save = input('Save cover image? (y/n): ').strip().lower()
-            if save == 'y':
-                ensure_results_dir()
-                ranobedb_id = identifiers.get('ranobedb', 'unknown')
-                filepath = RESULTS_DIR / f'cover_{ranobedb_id}.jpg'
-                with open(filepath, 'wb') as f:
-                    f.write(cover_data)
-                print(f'Cover saved to: {filepath}')
-
-            return True
-        else:
+        try:
+            source, cover_data = result_queue.get_nowait()
+        except Empty:
             print('\nNo cover found.')
             return False
 
+        print(f'\nCover downloaded successfully!')
+        print(f'Size: {len(cover_data)} bytes')
+
+        # Optionally save cover
+        save = input('Save cover image? (y/n): ').strip().lower()
+        if save == 'y':
+            ensure_results_dir()
+            ranobedb_id = identifiers.get('ranobedb', 'unknown')
+            filepath = RESULTS_DIR / f'cover_{ranobedb_id}.jpg'
+            with open(filepath, 'wb') as f:
+                f.write(cover_data)
+            print(f'Cover saved to: {filepath}')
+
+        return True
+
 
 def menu_search_title(tester: PluginTester):
     """Search by title only."""
@@ -290,9 +414,8 @@ def menu_search_title(tester: PluginTester):
 
     print(f'\nFound {len(results)} result(s):\n')
 
-    for i, mi in enumerate(results, 1):
-        print(format_metadata(mi, i))
-        print()
+    # Write the whole listing at once
+    sys.stdout.write(''.join(format_metadata(mi, i) + '\n\n' for i, mi in enumerate(results, 1)))
 
     # Save results
     results_data = [mi.to_dict() for mi in results]
@@ -343,9 +466,8 @@ def menu_search_title_author(tester: PluginTester):
 
     print(f'\nFound {len(results)} result(s):\n')
 
-    for i, mi in enumerate(results, 1):
-        print(format_metadata(mi, i))
-        print()
+    # Write the whole listing at once
+    sys.stdout.write(''.join(format_metadata(mi, i) + '\n\n' for i, mi in enumerate(results, 1)))
 
     # Save results
     results_data = [mi.to_dict() for mi in results]
@@ -420,33 +542,37 @@ def menu_view_results():
         print('No results directory found.')
         return
 
-    files = sorted(RESULTS_DIR.glob('*.json'), key=lambda x: x.stat().st_mtime, reverse=True)
+    # One directory scan; on POSIX DirEntry.stat() still costs a stat call per file (cached after)
+    with os.scandir(RESULTS_DIR) as it:
+        entries = [e for e in it if e.name.endswith('.json') and e.is_file()]
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
 
-    if not files:
+    if not entries:
         print('No saved results found.')
         return
 
-    print(f'\nFound {len(files)} saved result(s):\n')
+    print(f'\nFound {len(entries)} saved result(s):\n')
 
-    for i, f in enumerate(files[:20], 1):
+    # Only the 20 most recent are listed and selectable
+    files = [Path(e.path) for e in entries[:20]]
+    for i, f in enumerate(files, 1):
         print(f'[{i}] {f.name}')
 
-    if len(files) > 20:
-        print(f'\n... and {len(files) - 20} more')
+    if len(entries) > 20:
+        print(f'\n... and {len(entries) - 20} more')
 
     while True:
-        choice = input(f'\nView result (1-{min(len(files), 20)}) or 0 to go back: ').strip()
+        choice = input(f'\nView result (1-{len(files)}) or 0 to go back: ').strip()
         if choice == '0' or not choice:
             break
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(files):
-                with open(files[idx], 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                print('\n' + json.dumps(data, indent=2, ensure_ascii=False))
+                # Saved results are already indented JSON; print them as-is
+                print('\n' + files[idx].read_text(encoding='utf-8'))
             else:
                 print('Invalid selection.')
-        except (ValueError, json.JSONDecodeError) as e:
+        except (ValueError, OSError) as e:
             print(f'Error: {e}')
 
 
@@ -482,16 +608,22 @@ def menu_change_language(tester: PluginTester):
         return
 
     tester.plugin._prefs['language_order'] = new_order
+    tester.clear_cache()
     print(f'\nLanguage order changed to: {new_order}')
 
 
 def main_menu():
     """Main interactive menu."""
-    tester = PluginTester()
+    # Created on the first choice that needs the plugin, so viewing saved
+    # results never loads it
+    tester = None
 
     while True:
         print('\n')
-        current_lang = tester.plugin.prefs.get('language_order', 'en,romaji,ja')
+        if tester is None:
+            current_lang = 'en,romaji,ja'
+        else:
+            current_lang = tester.plugin.prefs.get('language_order', 'en,romaji,ja')
         print('=' * 50)
         print('  RanobeDB Light Novels - Plugin Tester')
         print('=' * 50)
@@ -510,6 +642,9 @@ def main_menu():
 
         choice = input('Enter choice (1-8): ').strip()
 
+        if choice in ('1', '2', '3', '4', '6', '7') and tester is None:
+            tester = PluginTester()
+
         if choice == '1':
             menu_search_title(tester)
         elif choice == '2':
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Check the language reported by _get_preferred_title.
+
+Expected values were recorded from the plugin before the ASCII title
+heuristic was made conditional, so any change in the reported language
+shows up here.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'tests'))
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+from test_interactive import load_plugin
+
+# (lang_order, book_data, expected (title, language))
+CASES = [
+    # Romaji equal to the ASCII main title, romaji preferred
+    (
+        ['romaji', 'en', 'ja'],
+        {'title': 'Sword Art Online', 'romaji': 'Sword Art Online', 'lang': 'ja'},
+        ('Sword Art Online', 'en'),
+    ),
+    # Romaji differs from the ASCII main title, romaji preferred
+    (
+        ['romaji', 'en', 'ja'],
+        {'title': 'Sword Art Online', 'romaji': 'Sodo Ato Onrain', 'lang': 'ja'},
+        ('Sodo Ato Onrain', 'ja'),
+    ),
+    # Japanese main title, Japanese preferred
+    (
+        ['ja', 'en', 'romaji'],
+        {'title': 'ソードアート・オンライン', 'romaji': 'Sodo Ato Onrain', 'lang': 'ja'},
+        ('ソードアート・オンライン', 'ja'),
+    ),
+    # ASCII main title used as the English fallback
+    (
+        ['en', 'romaji', 'ja'],
+        {'title': 'Sword Art Online', 'romaji': 'Sodo Ato Onrain', 'lang': 'ja'},
+        ('Sword Art Online', 'en'),
+    ),
+    # Explicit English title
+    (
+        ['en', 'romaji', 'ja'],
+        {'title': 'ソードアート・オンライン', 'lang': 'ja',
+         'titles': [{'lang': 'en', 'title': 'Sword Art Online'}]},
+        ('Sword Art Online', 'en'),
+    ),
+]
+
+
+def test_preferred_title_language():
+    plugin = load_plugin()()
+    for lang_order, book_data, expected in CASES:
+        got = plugin._get_preferred_title(book_data, lang_order=lang_order)
+        assert got == expected, f'{lang_order} {book_data}: got {got}, expected {expected}'
+
+
+if __name__ == '__main__':
+    test_preferred_title_language()
+    print('OK')